@@ -1,6 +1,15 @@
 import json
+import os
+import shutil
 from typing import Any, List, Dict, Optional, Union
 
+from json_io import dumps_json, loads_json
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
 
 def load_json(filename: str) -> Union[List[Any], Dict[str, Any]]:
     """
@@ -12,8 +21,8 @@ def load_json(filename: str) -> Union[List[Any], Dict[str, Any]]:
     :raises json.JSONDecodeError: If there's an issue decoding the JSON.
     """
     try:
-        with open(filename, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        with open(filename, 'rb') as f:
+            return loads_json(f.read())
     except FileNotFoundError:
         print(f"Error: File {filename} not found.")
         raise
@@ -29,8 +38,8 @@ def save_json(filename: str, data: Union[List[Any], Dict[str, Any]]) -> None:
     :param filename: Path to save the JSON data.
     :param data: Data to be saved.
     """
-    with open(filename, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=4, ensure_ascii=False)
+    with open(filename, 'wb') as f:
+        f.write(dumps_json(data))
 
 
 def count_headers(data: List[Dict[str, Any]]) -> int:
@@ -56,6 +65,48 @@ def get_first_header_index(data: List[Dict[str, Any]]) -> Optional[int]:
     return None
 
 
+def count_headers_in_file(filename: str) -> int:
+    """
+    Count the number of headers in a JSON file, streaming it when ijson is available.
+
+    :param filename: Path to the JSON file.
+    :return: Number of headers.
+    """
+    if ijson is None:
+        return count_headers(load_json(filename))
+    with open(filename, 'rb') as f:
+        return sum(1 for location in ijson.items(f, 'item.location') if location == 'header')
+
+
+def _move_headers(translation: List[Dict[str, Any]], header_difference: int) -> List[Dict[str, Any]]:
+    """
+    Relabel the first items of the translation as headers and move them before the first header.
+
+    :param translation: List of translated content items.
+    :param header_difference: Number of headers missing from the translation.
+    :return: Corrected list of translated content items (the translation list, modified in place).
+    """
+    corrected_items = [None] * header_difference
+    corrected_count = 0
+
+    for i in range(header_difference):
+        item = translation[i]
+        if item['location'] == 'body':
+            item['location'] = 'header'
+            item['modified'] = True
+            corrected_items[corrected_count] = item
+            corrected_count += 1
+    del corrected_items[corrected_count:]
+    del translation[:header_difference]
+    first_header_index = get_first_header_index(translation)
+    if first_header_index is not None:
+        translation[first_header_index:first_header_index] = corrected_items
+    else:
+        translation.extend(corrected_items)
+
+    return translation
+
+
 def correct_headers(origin: List[Dict[str, Any]], translation: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """
     Correct the headers in the translated data based on the original.
@@ -65,27 +116,56 @@ def correct_headers(origin: List[Dict[str, Any]], translation: List[Dict[str, An
     :return: Corrected list of translated content items.
     """
     origin_header_count = count_headers(origin)
-    translation_header_count = count_headers(translation)
-    header_difference = origin_header_count - translation_header_count
-    corrected_items = []
-
-    if header_difference > 0:
-        for i in range(header_difference):
-            if translation[i]['location'] == 'body':
-                translation[i]['location'] = 'header'
-                translation[i]['modified'] = True
-                corrected_items.append(translation[i])
-        translation = translation[header_difference:]
-        first_header_index = get_first_header_index(translation)
-        if first_header_index is not None:
-            translation[first_header_index:first_header_index] = corrected_items
-        else:
-            translation.extend(corrected_items)
+    if origin_header_count == 0:
+        return translation
 
-    return translation
+    header_difference = origin_header_count - count_headers(translation)
+    if header_difference <= 0:
+        return translation
+
+    return _move_headers(translation, header_difference)
+
+
+def correct_headers_streaming(origin_path: str, translation_path: str) -> Optional[List[Dict[str, Any]]]:
+    """
+    Correct the headers in a translated JSON file based on the original JSON file.
+
+    Headers are counted in the original file without building it in memory; the
+    translation is loaded once, and only if the original has any headers.
+
+    :param origin_path: Path to the original JSON file.
+    :param translation_path: Path to the translated JSON file.
+    :return: Corrected list of translated content items, or None if no correction is needed.
+    """
+    origin_header_count = count_headers_in_file(origin_path)
+    if origin_header_count == 0:
+        return None
+
+    translation = load_json(translation_path)
+    header_difference = origin_header_count - count_headers(translation)
+    if header_difference <= 0:
+        return None
+
+    return _move_headers(translation, header_difference)
+
+
+def is_up_to_date(output_path: str, *input_paths: str) -> bool:
+    """
+    Check whether an output file is newer than all of its input files.
+
+    :param output_path: Path to the generated file.
+    :param input_paths: Paths to the files it is generated from.
+    :return: True if the output and every input exist and the output was modified after every input.
+    """
+    try:
+        output_mtime = os.path.getmtime(output_path)
+        return all(output_mtime > os.path.getmtime(path) for path in input_paths)
+    except OSError:
+        return False
 
 
-def correct_translation_from_files(original_url: str, translation_url: str, output_path: str = 'corrected_translation.json') -> None:
+def correct_translation_from_files(original_url: str, translation_url: str, output_path: str = 'corrected_translation.json',
+                                   skip_if_fresh: bool = False) -> None:
     """
     Load JSON from original and translation URLs, correct the headers, 
     and save the corrected translation to an output file.
@@ -93,12 +173,21 @@ def correct_translation_from_files(original_url: str, translation_url: str, outp
     :param original_url: Path to the original JSON file.
     :param translation_url: Path to the translated JSON file.
     :param output_path: Path to save the corrected translation. Defaults to 'corrected_translation.json'.
+    :param skip_if_fresh: Skip the correction if the output is newer than both inputs. Only mtimes are
+        compared, so this is only safe when the output path is dedicated to these inputs. Defaults to False.
     """
     try:
-        origin = load_json(original_url)
-        translation = load_json(translation_url)
-        corrected_translation = correct_headers(origin, translation)
-        save_json(output_path, corrected_translation)
+        in_place = os.path.exists(output_path) and os.path.samefile(translation_url, output_path)
+        if skip_if_fresh and not in_place and is_up_to_date(output_path, original_url, translation_url):
+            print(f"{output_path} is up to date, skipping correction")
+            return
+
+        corrected_translation = correct_headers_streaming(original_url, translation_url)
+        if corrected_translation is not None:
+            save_json(output_path, corrected_translation)
+        elif not in_place:
+            # Nothing to correct: the translation is saved as is
+            shutil.copyfile(translation_url, output_path)
     except Exception as e:
         print(f"Error during the correction process: {e}")
 
@@ -1,99 +1,138 @@
+import io
+import os
+import sys
 from docx import Document
-from typing import Any, List, Dict, Union, Optional
-import json
-from xml.etree import ElementTree as ET
+from docx.table import Table
+from typing import Any, List, Dict, Iterable, Iterator, Union, Optional
+from lxml import etree as ET
+
+from json_io import JSON_INDENT, dumps_json
+
+
+NS = {
+    'w': 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'
+}
+W_NS = '{%s}' % NS['w']
+W_FOOTNOTE = sys.intern(W_NS + 'footnote')
+W_P = sys.intern(W_NS + 'p')
+W_R = sys.intern(W_NS + 'r')
+W_TBL = sys.intern(W_NS + 'tbl')
+
+_T_XP = ET.XPath('.//w:t', namespaces=NS)
 
 
 def remove_consecutive_duplicates(lst: List[Any]) -> List[Any]:
-    """Remove consecutive duplicates in a list."""
+    """
+    Remove consecutive duplicates in a list.
+
+    The input list is returned as is when it holds no consecutive duplicates;
+    a new list is only built once the first duplicate is found.
+    """
     if not lst:
         return []
 
-    new_lst = [lst[0]]
-    for i in range(1, len(lst)):
+    for first_dup in range(1, len(lst)):
+        if lst[first_dup] == lst[first_dup-1]:
+            break
+    else:
+        return lst
+
+    new_lst = lst[:first_dup]
+    for i in range(first_dup + 1, len(lst)):
         if lst[i] != lst[i-1]:
             new_lst.append(lst[i])
     return new_lst
 
 
+def _walk_block(container, location: Optional[str] = None,
+                table_location: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Extract paragraphs and tables from a block container, in document order.
+
+    Paragraph text is read straight from the XML runs, without building
+    python-docx Paragraph and Run objects.
+
+    :param container: Block container (document body, header, footer or cell).
+    :param location: Location tag added to text items, if any.
+    :param table_location: Location tag added to table items, if any.
+    :return: Iterator over the extracted content items.
+    """
+    for element in container._element.iterchildren(W_P, W_TBL):
+        if element.tag == W_TBL:
+            table_item = {"table": extract_table(Table(element, container))}
+            if table_location:
+                table_item["location"] = table_location
+            yield table_item
+        else:
+            paragraph_text = ''.join([r.text for r in element.iterchildren(W_R)]).strip()
+            if paragraph_text:
+                text_item = {"text": paragraph_text}
+                if location:
+                    text_item["location"] = location
+                yield text_item
+
+
+def _process_container(container, location: str) -> List[Dict[str, Any]]:
+    """Process content within a header or footer."""
+    local_content = list(_walk_block(container, location, location))
+
+    local_texts = [item for item in local_content if "text" in item]
+    local_tables = [item for item in local_content if "table" in item]
+    return local_texts + local_tables
+
+
 def extract_text_from_headers_and_footers(document: Document) -> List[Dict[str, Any]]:
     """
     Extract all text from the headers and footers of the document, including tables.
 
+    Sections linked to a previous header or footer share its part, which is
+    only walked once; its content is still repeated for every section.
+
     :param document: A loaded DOCX document.
     :return: List of extracted content items.
     """
     header_contents = []
     footer_contents = []
+    processed = {}
 
-    def process_container(container, location: str) -> List[Dict[str, Any]]:
-        """Process content within a header or footer."""
-        local_texts = []
-        local_tables = []
-
-        for element in container._element:
-            if element.tag.endswith('tbl'):
-                for table in container.tables:
-                    if table._element == element:
-                        table_data = extract_table(table)
-                        local_tables.append(
-                            {"table": table_data, "location": location})
-                        break
-            elif element.tag.endswith('p'):
-                paragraph = [
-                    p for p in container.paragraphs if p._element == element][0]
-                paragraph_text = ''.join(run.text for run in paragraph.runs)
-                if paragraph_text:
-                    paragraph_text = paragraph_text.strip()
-                    if paragraph_text:
-                        local_texts.append(
-                            {"text": paragraph_text, "location": location})
-
-        return local_texts + local_tables
+    def process_once(container, location: str) -> List[Dict[str, Any]]:
+        part = container.part
+        if part not in processed:
+            processed[part] = _process_container(container, location)
+            return processed[part]
+        return [dict(item) for item in processed[part]]
 
     for section in document.sections:
-        header = section.header
-        header_contents.extend(process_container(header, "header"))
-        footer = section.footer
-        footer_contents.extend(process_container(footer, "footer"))
+        header_contents.extend(process_once(section.header, "header"))
+        footer_contents.extend(process_once(section.footer, "footer"))
 
     # Ensuring headers come before footers in the contents list
     return header_contents + footer_contents
 
 
-def extract_content_from_document(document: Document) -> List[Dict[str, Any]]:
+def iter_content_from_document(document: Document) -> Iterator[Dict[str, Any]]:
     """
-    Extract content from the main body, headers, footers, footnotes, and endnotes of a DOCX document.
+    Iterate over the content of the main body, headers, footers, footnotes, and endnotes of a DOCX document.
+
+    Body items are yielded as they are extracted; only the (small) header, footer
+    and footnote lists are built in full.
 
     :param document: A loaded DOCX document.
-    :return: List of extracted content items.
+    :return: Iterator over the extracted content items.
     """
-    content_list = []
-
-    for element in document.element.body:
-        if element.tag.endswith('tbl'):
-            for table in document.tables:
-                if table._element == element:
-                    table_data = extract_table(table)
-                    content_list.append({"table": table_data})
-                    break
-        elif element.tag.endswith('p'):
-            paragraph = [
-                p for p in document.paragraphs if p._element == element][0]
-            paragraph_text = ''.join(run.text for run in paragraph.runs)
-            if paragraph_text:
-                paragraph_text = paragraph_text.strip()
-                if paragraph_text:
-                    content_list.append(
-                        {"text": paragraph_text, "location": "body"})
+    yield from _walk_block(document._body, location="body")
+    yield from extract_text_from_headers_and_footers(document)
+    yield from extract_footnotes_from_xml(document)
 
-    header_footer_texts = extract_text_from_headers_and_footers(document)
-    content_list.extend(header_footer_texts)
 
-    notes_texts = extract_footnotes_from_xml(document)
-    content_list.extend(notes_texts)
+def extract_content_from_document(document: Document) -> List[Dict[str, Any]]:
+    """
+    Extract content from the main body, headers, footers, footnotes, and endnotes of a DOCX document.
 
-    return content_list
+    :param document: A loaded DOCX document.
+    :return: List of extracted content items.
+    """
+    return list(iter_content_from_document(document))
 
 
 def extract_footnotes_from_xml(document: Document) -> List[Dict[str, Any]]:
@@ -108,42 +147,27 @@ def extract_footnotes_from_xml(document: Document) -> List[Dict[str, Any]]:
     if not footnotes_part:
         return footnotes
 
-    root = ET.fromstring(footnotes_part.blob)
-    namespaces = {
-        'w': 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'
-    }
-
-    for footnote in root.findall('.//w:footnote', namespaces=namespaces):
+    # Stream the footnotes part, freeing each footnote once it has been read
+    context = ET.iterparse(io.BytesIO(footnotes_part.blob),
+                           events=('end',), tag=W_FOOTNOTE)
+    for _, footnote in context:
         text = []
-        for child in footnote.findall('.//w:t', namespaces=namespaces):
+        for child in _T_XP(footnote):
             if child.text:
                 text.append(child.text)
         footnotes.append({'text': ' '.join(text).strip(), 'type': 'footnote'})
 
+        footnote.clear()
+        while footnote.getprevious() is not None:
+            del footnote.getparent()[0]
+    del context
+
     return footnotes
 
 
 def extract_content_from_cell(cell) -> List[Dict[str, Any]]:
     """Extract content from a cell, preserving the order of text and nested tables."""
-    content_list = []
-
-    for element in cell._element:
-        if element.tag.endswith('tbl'):
-            for table in cell.tables:
-                if table._element == element:
-                    table_data = extract_table(table)
-                    content_list.append({"table": table_data})
-                    break
-        elif element.tag.endswith('p'):
-            paragraph = [
-                p for p in cell.paragraphs if p._element == element][0]
-            paragraph_text = ''.join(run.text for run in paragraph.runs)
-            if paragraph_text:
-                paragraph_text = paragraph_text.strip()
-                if paragraph_text:
-                    content_list.append({"text": paragraph_text})
-
-    return content_list
+    return list(_walk_block(cell))
 
 
 def extract_table(table) -> List[List[Dict[str, Any]]]:
@@ -163,40 +187,95 @@ def extract_table(table) -> List[List[Dict[str, Any]]]:
     return table_data
 
 
-def extract_content_from_docx(file_path: str) -> List[Dict[str, Any]]:
+class ExtractionError(Exception):
+    """Raised when the content of a DOCX file cannot be extracted."""
+
+
+def iter_content_from_docx(file_path: str) -> Iterator[Dict[str, Any]]:
     """
-    Extract content from a DOCX file.
+    Iterate over the content of a DOCX file.
 
     :param file_path: Path to the DOCX file.
-    :return: List of extracted content items.
+    :return: Iterator over the extracted content items.
+    :raises ExtractionError: If the file cannot be opened or its content cannot be extracted.
     """
     try:
         document = Document(file_path)
-        return extract_content_from_document(document)
+        yield from iter_content_from_document(document)
     except Exception as e:
-        print(f"Error processing {file_path}. Reason: {str(e)}")
+        raise ExtractionError(f"Error processing {file_path}. Reason: {str(e)}") from e
+
+
+def extract_content_from_docx(file_path: str) -> List[Dict[str, Any]]:
+    """
+    Extract content from a DOCX file.
+
+    :param file_path: Path to the DOCX file.
+    :return: List of extracted content items, or an empty list if extraction fails.
+    """
+    try:
+        return list(iter_content_from_docx(file_path))
+    except ExtractionError as e:
+        print(e)
         return []
 
 
-def save_to_json(contents: List[Dict[str, Any]], output_path: str) -> None:
-    """Save extracted content to a JSON file."""
+def _dump_item(item: Dict[str, Any]) -> bytes:
+    """Serialize one content item as an indented element of a top-level JSON array."""
+    indent = b' ' * JSON_INDENT
+    return indent + dumps_json(item).replace(b'\n', b'\n' + indent)
+
+
+def save_to_json(contents: Iterable[Dict[str, Any]], output_path: str) -> bool:
+    """
+    Save extracted content to a JSON file.
+
+    Items are written one at a time, so ``contents`` can be a generator and is
+    never held in memory as a whole. They are written to a temporary file that
+    only replaces ``output_path`` once every item has been written.
+
+    :return: True if the file was saved, False if it could not be written.
+    :raises ExtractionError: If ``contents`` fails while being iterated; ``output_path`` is left untouched.
+    """
+    temp_path = output_path + '.tmp'
     try:
-        with open(output_path, 'w', encoding='utf-8') as json_file:
-            json.dump(contents, json_file, indent=4, ensure_ascii=False)
-        print(f"Data saved to {output_path}")
+        with open(temp_path, 'wb') as json_file:
+            separator = b'[\n'
+            for item in contents:
+                json_file.write(separator)
+                json_file.write(_dump_item(item))
+                separator = b',\n'
+            json_file.write(b'[]' if separator == b'[\n' else b'\n]')
+        os.replace(temp_path, output_path)
+    except ExtractionError:
+        raise
     except Exception as e:
         print(f"Error saving to {output_path}. Reason: {str(e)}")
+        return False
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
 
+    print(f"Data saved to {output_path}")
+    return True
 
-def process_docx_and_save_to_json(input_file_path: str, output_file_path: str) -> None:
+
+def process_docx_and_save_to_json(input_file_path: str, output_file_path: str) -> bool:
     """
     Extract content from a DOCX file and save the extracted content to a JSON file.
 
+    If extraction or saving fails, the error is reported and any existing output
+    file is left untouched.
+
     :param input_file_path: Path to the DOCX file.
     :param output_file_path: Path where the extracted content will be saved as JSON.
+    :return: True if the content was extracted and saved, False otherwise.
     """
-    contents = extract_content_from_docx(input_file_path)
-    save_to_json(contents, output_file_path)
+    try:
+        return save_to_json(iter_content_from_docx(input_file_path), output_file_path)
+    except ExtractionError as e:
+        print(e)
+        return False
 
 
 # Usage example:
@@ -0,0 +1,37 @@
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# orjson only supports 2-space indentation, so the stdlib fallback uses it too
+JSON_INDENT = 2
+
+
+def dumps_json(data: Any) -> bytes:
+    """
+    Serialize data to indented UTF-8 JSON.
+
+    orjson is used when it is installed; the stdlib fallback produces the same bytes.
+
+    :param data: Data to serialize.
+    :return: Encoded JSON document.
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=JSON_INDENT, ensure_ascii=False).encode('utf-8')
+
+
+def loads_json(raw: bytes) -> Any:
+    """
+    Parse a JSON document, with orjson when it is installed.
+
+    :param raw: Encoded JSON document.
+    :return: Decoded data.
+    :raises json.JSONDecodeError: If the document is not valid JSON.
+    """
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
@@ -1,20 +1,82 @@
+import atexit
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
 
 
-def setup_logger():
-    """Set up logging configuration."""
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(levelname)s - %(message)s',
-        filename='pairing.log',  # Log file name
-        filemode='a'  # append mode
-    )
+class BufferedStreamHandler(logging.StreamHandler):
+    """StreamHandler that leaves flushing to the stream's own buffer instead of flushing every record."""
 
-    # If you also want to see logs in the console, add a StreamHandler
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+        except Exception:
+            self.handleError(record)
+
+
+class LogListener(QueueListener):
+    """
+    QueueListener feeding from a QueueHandler on the root logger.
+
+    stop() detaches the QueueHandler, drains the queue and flushes the handlers;
+    it can safely be called more than once.
+    """
+
+    def __init__(self, queue_handler: QueueHandler, *handlers: logging.Handler) -> None:
+        super().__init__(queue_handler.queue, *handlers)
+        self.queue_handler = queue_handler
+        self.stopped = False
+
+    def stop(self) -> None:
+        if not self.stopped:
+            self.stopped = True
+            logging.getLogger().removeHandler(self.queue_handler)
+            super().stop()
+            for handler in self.handlers:
+                handler.flush()
+
+
+_listener: Optional[LogListener] = None
+
+
+def setup_logger() -> LogListener:
+    """
+    Set up logging configuration.
+
+    Records are put on a queue and written to the log file and the console by a
+    background listener thread. The listener is stopped, and the log file flushed and
+    closed, at exit; ``stop()`` can also be called on the returned listener beforehand.
+    Calling this again while the listener is running returns the same listener.
+    """
+    global _listener
+    if _listener is not None and not _listener.stopped:
+        return _listener
+
+    queue_handler = QueueHandler(queue.Queue(-1))
+    root = logging.getLogger()
+    root.setLevel(logging.INFO)
+    root.addHandler(queue_handler)
+
+    formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+
+    # Append mode, with a 64 KB buffer flushed when full or when the file is closed at exit
+    log_file = open('pairing.log', 'a', buffering=65536, encoding='utf-8')
+    atexit.register(log_file.close)
+    file_handler = BufferedStreamHandler(log_file)
+    file_handler.setFormatter(formatter)
+
+    # Also show logs in the console
     console = logging.StreamHandler()
     console.setLevel(logging.INFO)
-    formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
     console.setFormatter(formatter)
-    logging.getLogger().addHandler(console)
 
+    listener = LogListener(queue_handler, file_handler, console)
+    listener.start()
+
+    # atexit runs last-registered first: drain the queue before the log file is closed
+    atexit.register(listener.stop)
+
+    _listener = listener
     logging.info("Logger is initialized.")
+    return listener
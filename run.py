@@ -1,5 +1,6 @@
+from concurrent.futures import ProcessPoolExecutor
 from extraction import process_docx_and_save_to_json
-from correction import correct_translation_from_files
+from correction import correct_translation_from_files, is_up_to_date
 
 
 def main():
@@ -9,16 +10,31 @@ def main():
     original_docx_path = f"sources/KFS Paired document/{base_filename}_E.docx"
     translation_docx_path = f"sources/KFS Paired document/{base_filename}_C.docx"
     original_json_path = f"{base_filename}_E.json"
-    translation_json_path = f"{base_filename}_C.json"
-    corrected_translation_json_path = translation_json_path
+    # The raw extraction is kept apart from the corrected output, so that it
+    # can be reused on the next run without being corrected twice
+    translation_json_path = f"{base_filename}_C_extracted.json"
+    corrected_translation_json_path = f"{base_filename}_C.json"
 
-    # Extract content from the DOCX files and save to JSON files
-    process_docx_and_save_to_json(original_docx_path, original_json_path)
-    process_docx_and_save_to_json(translation_docx_path, translation_json_path)
+    # Extract content from the DOCX files and save to JSON files in parallel,
+    # unless the JSON is already newer than its DOCX
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        futures = []
+        for docx_path, json_path in ((original_docx_path, original_json_path),
+                                     (translation_docx_path, translation_json_path)):
+            if is_up_to_date(json_path, docx_path):
+                print(f"{json_path} is up to date, skipping extraction")
+            else:
+                futures.append(executor.submit(
+                    process_docx_and_save_to_json, docx_path, json_path))
+        extracted = [future.result() for future in futures]
+
+    if not all(extracted):
+        print("Extraction failed, skipping correction")
+        return
 
     # Correct the translation JSON using the original JSON
     correct_translation_from_files(
-        original_json_path, translation_json_path, corrected_translation_json_path)
+        original_json_path, translation_json_path, corrected_translation_json_path, skip_if_fresh=True)
 
 
 if __name__ == "__main__":